@@ -12,50 +12,101 @@ Usage:
 """
 
 import argparse
-import csv
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
+
+import matplotlib
+matplotlib.use('Agg')  # headless: never probe GUI backends
 
-import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import numpy as np
+import pandas as pd
+
+# Expected CSV columns and their dtypes (simd_level is a repeated string tag)
+CSV_DTYPES = {
+    'array_size': 'int64',
+    'median_ms': 'float64',
+    'mean_ms': 'float64',
+    'stddev_ms': 'float64',
+    'min_ms': 'float64',
+    'max_ms': 'float64',
+    'p99_ms': 'float64',
+    'gflops': 'float64',
+    'simd_level': 'string',
+}
 
+# Columnar (SoA) layout for one benchmark dataset: one contiguous typed
+# column per metric instead of parallel Python lists of boxed floats.
+BENCHMARK_DTYPE = np.dtype([
+    ('array_size', 'i8'),
+    ('median_ms', 'f8'),
+    ('mean_ms', 'f8'),
+    ('stddev_ms', 'f8'),
+    ('min_ms', 'f8'),
+    ('max_ms', 'f8'),
+    ('p99_ms', 'f8'),
+    ('gflops', 'f8'),
+])
 
-def read_csv_data(filepath: str) -> Tuple[List[int], List[float], List[float], List[float], List[float], List[float], List[float], List[float], str]:
+
+def read_csv_data(filepath: str) -> Tuple[np.ndarray, str]:
     """
     Read benchmark CSV data from file.
-    
+
+    Parsing happens in pandas' C engine rather than a per-row Python loop,
+    and the numeric columns are packed into a single structured array so
+    downstream code indexes them by field name with no further conversion.
+
+    A .npz sidecar next to the CSV caches the parsed columns; when it is
+    at least as new as the CSV, the binary cache is loaded directly and
+    text parsing is skipped entirely (useful when iterating on plot style).
+
     Returns:
-        Tuple of (array_sizes, median_ms, mean_ms, stddev_ms, min_ms, max_ms, p99_ms, gflops, simd_level)
+        Tuple of (records, simd_level) where records is a structured array
+        with BENCHMARK_DTYPE fields.
     """
-    array_sizes = []
-    median_ms = []
-    mean_ms = []
-    stddev_ms = []
-    min_ms = []
-    max_ms = []
-    p99_ms = []
-    gflops = []
-    simd_level = None
-    
     try:
-        with open(filepath, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                array_sizes.append(int(row['array_size']))
-                median_ms.append(float(row['median_ms']))
-                mean_ms.append(float(row['mean_ms']))
-                stddev_ms.append(float(row['stddev_ms']))
-                min_ms.append(float(row['min_ms']))
-                max_ms.append(float(row['max_ms']))
-                p99_ms.append(float(row['p99_ms']))
-                gflops.append(float(row['gflops']))
-                if simd_level is None:
-                    simd_level = row['simd_level']
-        
-        return array_sizes, median_ms, mean_ms, stddev_ms, min_ms, max_ms, p99_ms, gflops, simd_level
-    
+        csv_path = Path(filepath)
+        cache_path = csv_path.with_suffix('.npz')
+        try:
+            if cache_path.exists() and cache_path.stat().st_mtime >= csv_path.stat().st_mtime:
+                with np.load(cache_path) as cache:
+                    return cache['records'], str(cache['simd_level'])
+        except Exception:
+            pass  # corrupt/truncated sidecar - fall through and re-parse the CSV
+
+        df = pd.read_csv(filepath, dtype=CSV_DTYPES, engine='c')
+
+        records = np.empty(len(df), dtype=BENCHMARK_DTYPE)
+        for name in BENCHMARK_DTYPE.names:
+            records[name] = df[name].to_numpy()
+        simd_level = df['simd_level'].iat[0]
+
+        # Caching is best-effort: write to a temp file and rename it into
+        # place so a concurrent run never observes a half-written sidecar.
+        # The temp name keeps the .npz suffix so np.savez doesn't append one.
+        tmp_path = cache_path.with_name(f'{cache_path.stem}.{os.getpid()}.tmp.npz')
+        try:
+            np.savez(tmp_path, records=records, simd_level=np.array(simd_level))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                tmp_path.unlink()  # read-only data dir or similar
+            except OSError:
+                pass
+
+        return records, simd_level
+
     except FileNotFoundError:
         print(f"Error: File '{filepath}' not found.", file=sys.stderr)
         sys.exit(1)
@@ -63,40 +114,45 @@ def read_csv_data(filepath: str) -> Tuple[List[int], List[float], List[float], L
         print(f"Error: Missing column {e} in CSV file '{filepath}'.", file=sys.stderr)
         print("Expected columns: array_size,median_ms,mean_ms,stddev_ms,min_ms,max_ms,p99_ms,gflops,simd_level", file=sys.stderr)
         sys.exit(1)
-    except ValueError as e:
+    except (ValueError, pd.errors.ParserError) as e:
         print(f"Error: Invalid data format in '{filepath}': {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def plot_benchmark(datasets: Dict[str, Tuple], output_path: str, title: str, 
-                  metric: str = 'time', auto_title: bool = False):
+def render_metric(ax, datasets: Dict[str, Tuple], metric: str,
+                  rasterize: bool = False, max_points: int = 2000):
     """
-    Generate benchmark comparison chart.
-    
+    Render one metric for all datasets into an existing Axes.
+
+    Works on the already-parsed dataset dict, so the same data can be
+    drawn into several panels of one figure without re-reading CSVs.
+
     Args:
-        datasets: Dict mapping label -> (array_sizes, median_ms, mean_ms, stddev_ms, min_ms, max_ms, p99_ms, gflops, simd_level)
-        output_path: Path to save the output image
-        title: Chart title
+        ax: Target Axes
+        datasets: Dict mapping label -> (records, simd_level) where records
+                  is a structured array with BENCHMARK_DTYPE fields
         metric: 'time' or 'gflops' - which metric to plot
-        auto_title: Whether to auto-generate title from CPU names
+        rasterize: Rasterize the dense collections (for vector outputs)
+        max_points: Marker glyphs drawn per dataset before stride
+                    downsampling kicks in (lines/bands keep every point)
+
+    Returns:
+        Dataset labels in best-to-worst plotting order.
     """
-    plt.figure(figsize=(12, 7))
-    
-    # Sort datasets by performance (best to worst)
-    # For time metric: lower median = better, higher = worse
-    # Use the median time at the largest array size for sorting
+    # Sort datasets best to worst on the metric at the largest array size.
+    # Keys are precomputed once and sorted with C-coded itemgetter; gflops
+    # keys are negated so ascending order covers both metrics without a
+    # reverse branch.
     if metric == 'time':
-        sorted_items = sorted(datasets.items(), 
-                            key=lambda x: x[1][1][-1],  # x[1][1] = median_ms list, [-1] = last element
-                            reverse=False)  # Reverse=False for best-to-worst (lowest time first)
+        keyed = [(label, data, data[0]['median_ms'][-1])
+                 for label, data in datasets.items()]
     else:
-        # For gflops: higher = better
-        sorted_items = sorted(datasets.items(), 
-                            key=lambda x: x[1][7][-1],  # x[1][7] = gflops list, [-1] = last element
-                            reverse=True)  # Higher gflops first (best to worst)
-    
+        keyed = [(label, data, -data[0]['gflops'][-1])
+                 for label, data in datasets.items()]
+    keyed.sort(key=itemgetter(2))
+
     # Convert back to dict maintaining order
-    datasets = dict(sorted_items)
+    datasets = {label: data for label, data, _ in keyed}
     
     # Color scheme - expanded palette for many datasets
     colors = [
@@ -108,98 +164,92 @@ def plot_benchmark(datasets: Dict[str, Tuple], output_path: str, title: str,
     markers = ['o', 's', '^', 'D', 'v', 'p', '*', 'X', 'P', 'h', '<', '>', 
                'd', '8', 'H', '1', '2', '3', '4', '+', 'x']
     
+    # Batch all datasets into single collections: one LineCollection for
+    # the median lines, one PolyCollection for the ±1σ bands (which encode
+    # the error bars), and one scatter pass per marker glyph. This keeps
+    # the artist count constant instead of growing 3x per dataset.
+    segments = []
+    band_verts = []
+    color_list = []
+    legend_elements = []
+    marker_groups = {}  # marker glyph -> (x chunks, y chunks, per-point colors)
+
     for idx, (label, data) in enumerate(datasets.items()):
-        array_sizes, median_ms, mean_ms, stddev_ms, min_ms, max_ms, p99_ms, gflops, simd_level = data
-        
+        records, simd_level = data
+
         color = colors[idx % len(colors)]
         marker = markers[idx % len(markers)]
-        
+
+        # Legend proxy for this dataset, built here rather than in a second
+        # pass over the dict after plotting
+        legend_elements.append(Line2D([0], [0], marker=marker, color=color,
+                                      linewidth=1.5, markersize=5, label=label))
+
         if metric == 'time':
-            y_data = median_ms
-            y_std = stddev_ms
-            y_p99 = p99_ms
+            y = records['median_ms']
+            yerr = records['stddev_ms']
         else:
-            y_data = gflops
+            y = records['gflops']
             # For gflops, we don't have stddev, so approximate from min/max
-            y_std = [(max_val - min_val) / 4.0 for max_val, min_val in zip(max_ms, min_ms)]
-            y_p99 = gflops  # p99 doesn't make sense for gflops derived from median
-        
-        # Convert to numpy arrays for easier manipulation
-        x = np.array(array_sizes)
-        y = np.array(y_data)
-        yerr = np.array(y_std)
-        y_p99_arr = np.array(y_p99)
-        
-        # Plot main line (median)
-        line = plt.plot(x, y, 
-                       marker=marker, 
-                       markersize=3,
-                       linewidth=1.5,
-                       label=label,
-                       color=color,
-                       zorder=3)
-        
-        # Add shaded error region (±1 std dev)
-        plt.fill_between(x, y - yerr, y + yerr, 
-                        alpha=0.2, 
-                        color=color,
-                        zorder=1)
-        
-        # Add error bars
-        plt.errorbar(x, y, yerr=yerr,
-                    fmt='none',
-                    ecolor=color,
-                    alpha=0.4,
-                    capsize=2,
-                    capthick=0.5,
-                    linewidth=0.8,
-                    zorder=2)
-    
-    # Generate auto title if requested
-    if auto_title:
-        cpu_names = list(datasets.keys())
-        if len(cpu_names) == 1:
-            title = f"Vector Multiply Performance - {cpu_names[0]}"
-        elif len(cpu_names) == 2:
-            title = f"Vector Multiply Performance - {cpu_names[0]} vs {cpu_names[1]}"
+            yerr = (records['max_ms'] - records['min_ms']) * 0.25
+
+        x = records['array_size']
+
+        segments.append(np.column_stack([x, y]))
+        # Closed band outline: lower edge forward, upper edge reversed
+        band_verts.append(np.concatenate([np.column_stack([x, y - yerr]),
+                                          np.column_stack([x, y + yerr])[::-1]]))
+        color_list.append(color)
+
+        # Marker glyphs dominate Agg draw time for dense sweeps, so stride-
+        # downsample the marker layer only; line and band keep every point
+        if max_points and len(x) > max_points:
+            stride = len(x) // max_points
+            marker_x, marker_y = x[::stride], y[::stride]
         else:
-            title = f"Vector Multiply Performance - {len(cpu_names)} CPU Comparison"
-    
-    # Labels and title
+            marker_x, marker_y = x, y
+
+        xs, ys, point_colors = marker_groups.setdefault(marker, ([], [], []))
+        xs.append(marker_x)
+        ys.append(marker_y)
+        point_colors.extend([color] * len(marker_x))
+
+    ax.add_collection(PolyCollection(band_verts, facecolors=color_list,
+                                     alpha=0.2, zorder=1, rasterized=rasterize))
+    ax.add_collection(LineCollection(segments, colors=color_list,
+                                     linewidths=1.5, zorder=3, rasterized=rasterize))
+    for marker, (xs, ys, point_colors) in marker_groups.items():
+        ax.scatter(np.concatenate(xs), np.concatenate(ys),
+                   s=9, c=point_colors, marker=marker, zorder=4,
+                   rasterized=rasterize)
+    ax.autoscale_view()
+
+    # Labels
     xlabel = 'Number of elements (32-bit floats, 4 bytes each)'
-    plt.xlabel(xlabel, fontsize=11)
-    
+    ax.set_xlabel(xlabel, fontsize=11)
+
     if metric == 'time':
-        ylabel = 'Time [s] - lower is better'
+        ylabel = 'Time [ms] - lower is better'
     else:
         ylabel = 'GFLOP/s - higher is better'
-    
-    plt.ylabel(ylabel, fontsize=11)
-    plt.title(title, fontsize=13, fontweight='bold')
-    
-    # Create custom legend
+
+    ax.set_ylabel(ylabel, fontsize=11)
+
+    # Custom legend from the proxy handles collected in the dataset loop
     if metric == 'time':
-        # Add explanation for the visual elements
-        legend_elements = []
-        for idx, label in enumerate(datasets.keys()):
-            color = colors[idx % len(colors)]
-            marker = markers[idx % len(markers)]
-            legend_elements.append(plt.Line2D([0], [0], marker=marker, color=color, 
-                                             linewidth=1.5, markersize=5, label=label))
-        
-        # Add legend entries for error visualization
+        # Add legend entry for error visualization
         from matplotlib.patches import Patch
         legend_elements.append(Patch(facecolor='gray', alpha=0.2, label='±1σ region'))
-        
-        plt.legend(handles=legend_elements, loc='upper left', fontsize=9)
+        ax.legend(handles=legend_elements, loc='upper left', fontsize=9)
     else:
-        plt.legend(loc='upper left', fontsize=10)
-    
-    plt.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
+        ax.legend(handles=legend_elements, loc='upper left', fontsize=10)
+
+    ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
     
-    # Format x-axis to show clean numbers without scientific notation
-    ax = plt.gca()
-    ax.set_xlim(left=0, right=max([max(data[0]) for data in datasets.values()]) * 1.05)
+    # Format x-axis to show clean numbers without scientific notation.
+    # The bench harness sweeps array sizes in ascending order, so the last
+    # element of each column is its maximum - no per-array scan needed.
+    ax.set_xlim(left=0, right=max(data[0]['array_size'][-1] for data in datasets.values()) * 1.05)
     
     # Add note about trials below x-axis
     ax.text(0.5, -0.1, '10 trials per data point, same build, GCC 15.2', 
@@ -211,91 +261,120 @@ def plot_benchmark(datasets: Dict[str, Tuple], output_path: str, title: str,
     
     if metric == 'time':
         ax.set_ylim(bottom=0)
-        
-        # Add secondary y-axis for milliseconds
-        ax2 = ax.twinx()
-        # Get the y-limits from the primary axis (in seconds)
-        y_min, y_max = ax.get_ylim()
-        # Set the secondary axis to show the same range but in milliseconds
-        ax2.set_ylim(y_min * 1000, y_max * 1000)
-        ax2.set_ylabel('Time [ms] - lower is better', fontsize=10)
-        
-        # Increase the number of ticks on the secondary axis
-        ax2.yaxis.set_major_locator(ticker.MaxNLocator(nbins=25, integer=False))
-        # Add minor ticks for even finer granularity (without labels)
-        ax2.yaxis.set_minor_locator(ticker.AutoMinorLocator(2))
-        ax2.tick_params(which='minor', length=3, color='gray')
-        ax2.grid(False)  # Don't show grid for secondary axis
-    
-    # Custom formatter for x-axis: show values as K, M
-    def format_func(value, tick_number):
-        if value == 0:
-            return '0'
-        elif value >= 1_000_000:
-            # Format as millions
-            if value % 1_000_000 == 0:
-                return f'{int(value / 1_000_000)}M'
-            else:
-                return f'{value / 1_000_000:.1f}M'
-        elif value >= 1_000:
-            # Format as thousands
-            if value % 1_000 == 0:
-                return f'{int(value / 1_000)}K'
-            else:
-                return f'{value / 1_000:.1f}K'
+
+    # X-axis tick labels as K/M: pick the unit once from the axis range and
+    # pin locator + formatter, instead of re-branching per tick on every draw
+    xmax = ax.get_xlim()[1]
+    if xmax >= 1_000_000:
+        divisor, suffix = 1_000_000, 'M'
+    elif xmax >= 1_000:
+        divisor, suffix = 1_000, 'K'
+    else:
+        divisor, suffix = 1, ''
+
+    tick_locs = ax.get_xticks()
+    tick_labels = [f'{loc / divisor:g}{suffix}' if loc else '0' for loc in tick_locs]
+    ax.xaxis.set_major_locator(ticker.FixedLocator(tick_locs))
+    ax.xaxis.set_major_formatter(ticker.FixedFormatter(tick_labels))
+
+    return list(datasets.keys())
+
+
+def plot_benchmark(datasets: Dict[str, Tuple], output_path: str, title: str,
+                  metric: str = 'time', auto_title: bool = False, dpi: int = 100,
+                  max_points: int = 2000):
+    """
+    Generate benchmark comparison chart.
+
+    Args:
+        datasets: Dict mapping label -> (records, simd_level) where records
+                  is a structured array with BENCHMARK_DTYPE fields
+        output_path: Path to save the output image
+        title: Chart title
+        metric: 'time', 'gflops', or 'both' for side-by-side panels
+        auto_title: Whether to auto-generate title from CPU names
+        dpi: Raster resolution for the saved image
+        max_points: Marker glyphs drawn per dataset before stride
+                    downsampling kicks in (lines/bands keep every point)
+    """
+    # For vector outputs, rasterize the dense collections so PDF/SVG files
+    # stay small instead of embedding every band/marker path
+    rasterize = Path(output_path).suffix.lower() in ('.pdf', '.svg')
+
+    # Build the figure through the OO API: no pyplot figure registry, no
+    # current-axes global state. The parsed datasets are rendered into one
+    # or two panels of the same figure without re-reading anything.
+    if metric == 'both':
+        fig = Figure(figsize=(20, 7))
+        FigureCanvasAgg(fig)
+        ax_time, ax_gflops = fig.subplots(1, 2)
+        cpu_names = render_metric(ax_time, datasets, 'time', rasterize, max_points)
+        render_metric(ax_gflops, datasets, 'gflops', rasterize, max_points)
+    else:
+        fig = Figure(figsize=(12, 7))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        cpu_names = render_metric(ax, datasets, metric, rasterize, max_points)
+
+    # Generate auto title if requested (names in best-to-worst order)
+    if auto_title:
+        if len(cpu_names) == 1:
+            title = f"Vector Multiply Performance - {cpu_names[0]}"
+        elif len(cpu_names) == 2:
+            title = f"Vector Multiply Performance - {cpu_names[0]} vs {cpu_names[1]}"
         else:
-            return f'{int(value)}'
-    
-    ax.xaxis.set_major_formatter(ticker.FuncFormatter(format_func))
-    
-    # Tight layout to prevent label cutoff
-    plt.tight_layout()
-    
+            title = f"Vector Multiply Performance - {len(cpu_names)} CPU Comparison"
+
+    if metric == 'both':
+        fig.suptitle(title, fontsize=13, fontweight='bold')
+        fig.tight_layout(rect=(0, 0, 1, 0.96))
+    else:
+        ax.set_title(title, fontsize=13, fontweight='bold')
+        # Tight layout to prevent label cutoff
+        fig.tight_layout()
+
     # Save the figure
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
+    save_kwargs = {'dpi': dpi, 'bbox_inches': 'tight'}
+    if output_file.suffix.lower() == '.png':
+        save_kwargs['pil_kwargs'] = {'optimize': True, 'compress_level': 6}
+    fig.savefig(output_path, **save_kwargs)
     print(f"Chart saved to: {output_path}")
 
 
+# SIMD level suffix on result filenames, matched in one pass instead of
+# checking every underscore split point against every known pattern
+_SIMD_RE = re.compile(r'_(avx_?512f|avx2|avx|sse4_?2|sse2|scalar)$')
+
+
+@lru_cache(maxsize=None)
 def infer_label_from_filename(filepath: str) -> str:
     """
     Infer a human-readable label from the filename.
-    
+
+    Pure function of the path string, so repeated paths (overlapping shell
+    globs) are parsed once and served from the cache afterwards.
+
     Examples:
         results_amd_ryzen_9_9950x3d_avx_512f.csv -> AMD Ryzen 9 9950X3D (AVX-512F)
         results_intel_xeon_e5_2680_v4_avx2.csv -> Intel Xeon E5-2680 v4 (AVX2)
     """
     filename = Path(filepath).stem  # Get filename without extension
-    
+
     # Remove 'results_' prefix if present
     if filename.startswith('results_'):
         filename = filename[8:]
-    
-    # Split by underscores
-    parts = filename.split('_')
-    
-    # Try to identify SIMD level (usually at the end)
-    simd_patterns = ['avx_512f', 'avx512f', 'avx2', 'avx', 'sse4_2', 'sse42', 'sse2', 'scalar']
-    simd_level = None
-    cpu_parts = []
-    
-    # Find where SIMD level starts
-    for i, part in enumerate(parts):
-        # Check if this and following parts form a SIMD level
-        remaining = '_'.join(parts[i:])
-        if any(remaining.startswith(pattern) for pattern in simd_patterns):
-            cpu_parts = parts[:i]
-            simd_level = remaining
-            break
-    
-    if not simd_level:
+
+    # Identify the SIMD level suffix
+    match = _SIMD_RE.search(filename)
+    if not match:
         # Couldn't parse, just use the filename
         return filename.replace('_', ' ').title()
-    
+
     # Format CPU name
-    cpu_name = ' '.join(cpu_parts).upper()
-    
+    cpu_name = filename[:match.start()].replace('_', ' ').upper()
+
     # Format SIMD level
     simd_map = {
         'avx_512f': 'AVX-512F',
@@ -307,8 +386,9 @@ def infer_label_from_filename(filepath: str) -> str:
         'sse2': 'SSE2',
         'scalar': 'Scalar'
     }
+    simd_level = match.group(1)
     simd_display = simd_map.get(simd_level, simd_level.upper())
-    
+
     return f"{cpu_name} ({simd_display})"
 
 
@@ -334,19 +414,28 @@ Examples:
   
   # Plot GFLOP/s instead of time
   python plot_benchmark.py bench/data/*.csv --metric gflops
+
+  # Plot time and GFLOP/s panels in one figure
+  python plot_benchmark.py bench/data/*.csv --metric both
         """
     )
     
+    # Positional files and --input share one dest: extend merges both into
+    # a single list in command-line order
     parser.add_argument(
         'files',
         nargs='*',
+        action='extend',
+        default=[],
         metavar='FILE',
         help='Input CSV files (labels auto-inferred from filenames)'
     )
-    
+
     parser.add_argument(
         '--input', '-i',
         nargs='+',
+        action='extend',
+        dest='files',
         metavar='FILE[:LABEL]',
         help='Input CSV files with optional labels, format: file.csv or file.csv:Label'
     )
@@ -365,29 +454,36 @@ Examples:
     
     parser.add_argument(
         '--metric', '-m',
-        choices=['time', 'gflops'],
+        choices=['time', 'gflops', 'both'],
         default='time',
-        help='Metric to plot: time (ms) or gflops (default: time)'
+        help='Metric to plot: time (ms), gflops, or both side by side (default: time)'
+    )
+
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=100,
+        help='Raster resolution of the saved chart (default: 100)'
+    )
+
+    parser.add_argument(
+        '--max-points',
+        type=int,
+        default=2000,
+        help='Marker glyphs per dataset before downsampling; lines keep every point (default: 2000)'
     )
     
     args = parser.parse_args()
-    
-    # Collect all input files
-    input_specs = []
-    
-    # Add positional file arguments
-    if args.files:
-        input_specs.extend(args.files)
-    
-    # Add --input arguments
-    if args.input:
-        input_specs.extend(args.input)
-    
+
+    input_specs = args.files
     if not input_specs:
         parser.error("No input files specified. Provide files as positional arguments or use --input")
     
-    # Parse input files and labels
-    datasets = {}
+    # Resolve (filepath, label) pairs up front, keeping only the first
+    # occurrence of each path: overlapping globs would otherwise parse the
+    # same file twice and race two threads over its cache sidecar
+    specs = []
+    seen_paths = set()
     for input_spec in input_specs:
         if ':' in input_spec:
             # Explicit label provided
@@ -396,14 +492,24 @@ Examples:
             # Infer label from filename
             filepath = input_spec
             label = infer_label_from_filename(filepath)
-        
+        if filepath in seen_paths:
+            continue
+        seen_paths.add(filepath)
+        specs.append((filepath, label))
+
+    # Parse all CSVs concurrently - pandas releases the GIL inside its C
+    # parser, so threads overlap disk reads and parsing across files.
+    # executor.map preserves input order, so insertion order is kept.
+    with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+        parsed = list(executor.map(lambda spec: read_csv_data(spec[0]), specs))
+
+    datasets = {}
+    for (filepath, label), (records, simd_level) in zip(specs, parsed):
+        datasets[label] = (records, simd_level)
+
         print(f"Reading {filepath} (label: {label})...")
-        data = read_csv_data(filepath)
-        datasets[label] = data
-        
-        array_sizes, median_ms, mean_ms, stddev_ms, min_ms, max_ms, p99_ms, gflops, simd_level = data
         print(f"  - SIMD level: {simd_level}")
-        print(f"  - Data points: {len(array_sizes)}")
+        print(f"  - Data points: {len(records)}")
         print(f"  - Statistical trials per size (10 trials with median, stddev, p99)")
     
     # Determine if we should auto-generate title
@@ -412,7 +518,8 @@ Examples:
     
     # Generate the plot
     print(f"\nGenerating chart...")
-    plot_benchmark(datasets, args.output, title, args.metric, auto_title)
+    plot_benchmark(datasets, args.output, title, args.metric, auto_title,
+                   args.dpi, args.max_points)
     print("Done!")
 
 